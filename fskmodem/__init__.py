@@ -27,6 +27,7 @@
 __docformat__ = 'google'
 
 from fskmodem.modem import HDLC
+from fskmodem.modem import Framer
 from fskmodem.modem import FSKBase
 from fskmodem.modem import FSKTransmit
 from fskmodem.modem import FSKReceive
@@ -48,14 +48,16 @@ See the [minimodem manpage](http://www.whence.com/minimodem/minimodem.1.html) fo
 '''
 
 import os
+import re
 import sys
 import time
 import random
 import atexit
 import shutil
+import selectors
 import threading
 import subprocess
-from subprocess import PIPE, CalledProcessError, SubprocessError
+from subprocess import PIPE, CalledProcessError, SubprocessError, TimeoutExpired
 
 
 class HDLC:
@@ -72,6 +74,113 @@ class HDLC:
     STOP = b'<|'
 
 
+# compiled scanner matching both framing flags in a single pass over the buffer
+_FRAME_RE = re.compile(re.escape(HDLC.START) + b'|' + re.escape(HDLC.STOP))
+
+# full file path for minimodem executable, resolved once at import
+_MINIMODEM_PATH = shutil.which('minimodem')
+
+# full file path for stdbuf executable, used to unbuffer minimodem stdout in rx mode
+_STDBUF_PATH = shutil.which('stdbuf')
+
+# bytes outside printable ASCII and common whitespace (tab, newline, carriage return)
+# are treated as receiver noise; this is deliberately narrower than the per-byte utf-8
+# check it replaced, which also passed the remaining 0x00 - 0x1f control bytes and 0x7f
+_NOISE_BYTES = bytes(byte for byte in range(256) if not (0x20 <= byte <= 0x7e or byte in b'\t\n\r'))
+
+# matches the card and device numbers in an arecord/aplay device listing line
+_ALSA_CARD_DEV_RE = re.compile(rb'card\s+(\d+):[^\n]*device\s+(\d+):')
+
+
+class Framer:
+    '''Extract HDLC-framed packets from an incoming byte stream.
+
+    Incoming bytes are accumulated in an internal buffer and scanned incrementally for framing flags. The scan itself runs inside the compiled delimiter pattern, so per-byte cost is native regex-engine cost rather than Python bytecode. Buffer memory is bounded at O(MTU) plus one fed chunk.
+
+    Attributes:
+        mtu (int): Maximum size of packet to be extracted, longer frames are dropped
+    '''
+
+    def __init__(self, mtu):
+        '''Initialize Framer class instance.
+
+        Args:
+            mtu (int): Maximum size of packet to be extracted
+
+        Returns:
+            fskmodem.Framer: Framer instance object
+        '''
+        self.mtu = mtu
+        self._buffer = bytearray()
+        self._search_from = 0
+        # index of the first data byte of the current frame, or None if no start delimiter seen
+        self._frame_start = None
+
+    def feed(self, chunk, callback):
+        '''Feed received bytes to the framer and deliver completed packets.
+
+        The callback is invoked once per completed packet, so feeding a chunk that completes no packets (the common case) allocates nothing.
+
+        Args:
+            chunk (bytes): received byte string to append to the internal buffer
+            callback (function): Function to call with each completed packet (type *bytes*)
+        '''
+        data_buffer = self._buffer
+        search_from = self._search_from
+        frame_start = self._frame_start
+        # bind hot attribute lookups to local names for the scan loop
+        start_flag = HDLC.START
+        mtu = self.mtu
+
+        data_buffer.extend(chunk)
+
+        # both framing flags contain b'|' (0x7c), so new data without that byte cannot
+        # contain a delimiter; the single-byte find is a cheap C-level prefilter that
+        # skips the pattern scan entirely on delimiter-free noise
+        pipe_index = data_buffer.find(0x7c, search_from)
+
+        if pipe_index >= 0:
+            # a delimiter can begin at most one byte before the first b'|'
+            scan_from = max(search_from, pipe_index - 1)
+
+            # scan new data once for both delimiters with the compiled pattern
+            for match in _FRAME_RE.finditer(data_buffer, scan_from):
+                if match.group() == start_flag:
+                    # frame restarts at the most recent start delimiter
+                    frame_start = match.end()
+                elif frame_start is not None:
+                    # empty or over max packet length frames are dropped
+                    if 0 < match.start() - frame_start <= mtu:
+                        # memoryview slice avoids an intermediate bytearray copy,
+                        # leaving one bytes allocation per delivered frame
+                        callback( bytes(memoryview(data_buffer)[frame_start:match.start()]) )
+                    frame_start = None
+
+                search_from = match.end()
+
+        # avoid missing a delimiter split over multiple fed chunks
+        tail = len(data_buffer) - (len(start_flag) - 1)
+        if tail > search_from:
+            search_from = tail
+
+        # drop the frame only once no stop delimiter can still complete a packet
+        # within the max packet size, since pending bytes may include a partial
+        # stop delimiter that is not payload (ex. b'<' of b'<|' split over chunks)
+        if frame_start is not None and len(data_buffer) - frame_start > mtu + len(HDLC.STOP) - 1:
+            frame_start = None
+
+        # compact the buffer once the consumed prefix gets large
+        keep_from = search_from if frame_start is None else frame_start
+        if keep_from > mtu:
+            del data_buffer[:keep_from]
+            search_from -= keep_from
+            if frame_start is not None:
+                frame_start -= keep_from
+
+        self._search_from = search_from
+        self._frame_start = frame_start
+
+
 class FSKBase:
     '''Create and interact with a minimodem subprocess.
 
@@ -114,39 +223,36 @@ class FSKBase:
         self.space = space
         self.online = False
         self._process = None
-        self._shell_cmd = None
+        self._cmd = None
 
-        # get full file path for minimodem executable
-        exec_path = shutil.which('minimodem')
-        
-        if exec_path is None:
+        if _MINIMODEM_PATH is None:
             # minimodem not installed
             raise ProcessLookupError('minimodem application not installed, try: sudo apt install minimodem')
 
         # configure minimodem comand line switches
-        switch_alsa_dev = None
-        switch_sync_byte = None
-        switch_confidence = None
-        switch_mark = None
-        switch_space = None
-        switch_mode = '--{}'.format(self.mode)
-        switch_filter = '--print-filter'
+        switches = ['--{}'.format(self.mode)]
 
         if self.alsa_dev is not None:
-            switch_alsa_dev = '--alsa={}'.format(self.alsa_dev)
-        if self.sync_byte is not None:
-            switch_sync_byte = '--sync-byte {}'.format(self.sync_byte)
+            switches.append('--alsa={}'.format(self.alsa_dev))
         if self.confidence is not None:
-            switch_confidence = '--confidence {}'.format(self.confidence)
+            switches.extend(['--confidence', str(self.confidence)])
+        if self.sync_byte is not None:
+            switches.extend(['--sync-byte', str(self.sync_byte)])
+
+        switches.append('--print-filter')
+
         if self.mark is not None:
-            switch_mark = '--mark {}'.format(self.mark)
+            switches.extend(['--mark', str(self.mark)])
         if self.space is not None:
-            switch_space = '--space {}'.format(self.space)
+            switches.extend(['--space', str(self.space)])
 
-        switches = [switch_mode, switch_alsa_dev, switch_confidence, switch_sync_byte, switch_filter, switch_mark, switch_space]
-        switches = [switch for switch in switches if switch is not None]
         # note from minimodem docs: confidence, sync byte, quiet, and print filter are ignored in tx mode
-        self._shell_cmd = '{} {} {}'.format(exec_path, ' '.join(switches), self.baudmode)
+        self._cmd = [_MINIMODEM_PATH] + switches + [self.baudmode]
+
+        if self.mode in ('rx', 'receive', 'read') and _STDBUF_PATH is not None:
+            # unbuffer minimodem stdout so decoded characters reach the pipe immediately,
+            # instead of accumulating in the C library's default pipe buffer
+            self._cmd = [_STDBUF_PATH, '-o0'] + self._cmd
 
         if start:
             self.start()
@@ -157,7 +263,7 @@ class FSKBase:
             return
             
         # create subprocess with pipes for interaction with child process
-        self._process = subprocess.Popen(self._shell_cmd, shell=True, bufsize=-1, stdin=PIPE, stdout=PIPE, stderr=PIPE)
+        self._process = subprocess.Popen(self._cmd, bufsize=-1, stdin=PIPE, stdout=PIPE, stderr=PIPE)
 
         time.sleep(0.1)
         
@@ -171,26 +277,22 @@ class FSKBase:
     def stop(self):
         '''Stop minimodem subprocess.'''
         self.online = False
-        # try to terminate normally
+
+        if self._process is None:
+            return
+
+        # try to terminate normally, kill if the process does not exit in time
         self._process.terminate()
-        # use a thread to communicate non-blocking-ly
-        comm_thread = threading.Thread(target=self._process.communicate)
-        comm_thread.daemon = True
-        comm_thread.start()
-        
-        comm_start = time.time()
-        comm_timeout = 5
-        # manual timeout
-        while time.time() < comm_start + comm_timeout:
-            time.sleep(1)
-
-        if self._process.poll() == None:
-            # if the process still hasn't stopped, try to kill it
+        try:
+            self._process.wait(timeout=5)
+        except TimeoutExpired:
             self._process.kill()
-            # use a thread to communicate non-blocking-ly
-            comm_thread = threading.Thread(target=self._process.communicate)
-            comm_thread.daemon = True
-            comm_thread.start()
+            self._process.wait()
+        finally:
+            # close pipes explicitly to reclaim the file descriptors
+            for pipe in (self._process.stdin, self._process.stdout, self._process.stderr):
+                if pipe is not None:
+                    pipe.close()
 
 
 class FSKReceive(FSKBase):
@@ -212,20 +314,54 @@ class FSKReceive(FSKBase):
             fskmodem.FSKRecieve: FSKReceive instance object
         '''
         self.mode = 'rx'
+        self._stdout_fd = None
         super().__init__(self.mode, **kwargs)
 
+    def start(self):
+        '''Start minimodem subprocess and configure non-blocking reads.'''
+        super().start()
+        # cache the stdout file descriptor and make reads non-blocking so
+        # chunk reads return whatever is currently available in the pipe
+        self._stdout_fd = self._process.stdout.fileno()
+        os.set_blocking(self._stdout_fd, False)
+
+    def receive_available(self, max_size=4096):
+        '''Receive available data from minimodem subprocess without blocking.
+
+        Reads a chunk of up to *max_size* bytes from the subprocess pipe in a single call, avoiding one read per received byte.
+
+        Args:
+            max_size (int): Maximum number of bytes to read from the subprocess pipe, defaults to 4096
+
+        Returns:
+            bytes: Received byte string (b'' if no data is available)
+        '''
+        try:
+            return os.read(self._stdout_fd, max_size)
+        except BlockingIOError:
+            return b''
+        except OSError:
+            # descriptor closed by stop() from another thread
+            return b''
+
     def receive(self, size=1):
         '''Receive data from minimodem subprocess.
 
-        Reading from the subprocess.Popen.stdout pipe is blocking until the specified number of bytes is available.
+        The subprocess.Popen.stdout pipe is non-blocking (see start), so the read returns immediately with up to the specified number of bytes.
 
         Args:
-            size (int): Number of bytes to read from the subprocess pipe
+            size (int): Maximum number of bytes to read from the subprocess pipe
 
         Returns:
-            bytes: Received byte string of specified length
+            bytes: Received byte string (may be b'' if no data is available)
         '''
-        return self._process.stdout.read(size)
+        data = self._process.stdout.read(size)
+
+        # a non-blocking read returns None when no data is available
+        if data is None:
+            return b''
+
+        return data
 
     def get_stderr(self, size=1):
         '''Get stderr data from minimodem subprocess.
@@ -274,6 +410,29 @@ class FSKTransmit(FSKBase):
         self._process.stdin.write(data)
         self._process.stdin.flush()
 
+    def send_frames(self, *parts):
+        '''Send data fragments to the minimodem subprocess in a single write.
+
+        Fragments are gathered with os.writev when available, so framing flags and payload reach the subprocess pipe in one write call without being joined into an intermediate byte string.
+
+        Args:
+            *parts (bytes): byte string fragments to send to the subprocess pipe
+        '''
+        if self.sync_byte is not None:
+            parts = (self.sync_byte.encode('utf-8'),) + parts
+
+        if hasattr(os, 'writev'):
+            total = sum(len(part) for part in parts)
+            written = os.writev(self._process.stdin.fileno(), parts)
+
+            if written < total:
+                # partial write, send the remainder normally
+                self._process.stdin.write(b''.join(parts)[written:])
+                self._process.stdin.flush()
+        else:
+            self._process.stdin.write(b''.join(parts))
+            self._process.stdin.flush()
+
 
 class Modem:
     '''Create and manage an AFSK soft modem.
@@ -324,27 +483,21 @@ class Modem:
         else:
             raise Exception('Unknown device type: {}'.format(device_type))
     
-        alsa_dev = None
         # get audio device descriptions
-        alsa_devs = subprocess.check_output(alsa_cmd).decode('utf-8').split('\n')
-    
-        for line in alsa_devs:
-            if device_desc in line:
-                # capture the card number
-                start = 'card'
-                end = ':'
-                start_index = line.find(start) + len(start)
-                end_index = line.find(end, start_index)
-                card = line[start_index:end_index].strip()
-                
-                # capture the device number
-                start = 'device'
-                end = ':'
-                start_index = line.find(start) + len(start)
-                end_index = line.find(end, start_index)
-                device = line[start_index:end_index].strip()
-                
-                return '{},{}'.format(card, device)
+        alsa_devs = subprocess.check_output(alsa_cmd)
+        device_desc = device_desc.encode('utf-8')
+
+        # capture the card and device numbers in a single pass
+        for match in _ALSA_CARD_DEV_RE.finditer(alsa_devs):
+            # limit the description check to the matched line
+            line_start = alsa_devs.rfind(b'\n', 0, match.start()) + 1
+            line_end = alsa_devs.find(b'\n', match.end())
+            if line_end < 0:
+                line_end = len(alsa_devs)
+
+            if device_desc in alsa_devs[line_start:line_end]:
+                card, device = match.groups()
+                return '{},{}'.format(card.decode('utf-8'), device.decode('utf-8'))
 
     def __init__(self, search_alsa_in=None, search_alsa_out=None, alsa_in=None, alsa_out=None, baudmode=300, sync_byte=None, confidence=1.5, mark=None, space=None, start=True):
         '''Initialize Modem class instance.
@@ -405,8 +558,17 @@ class Modem:
         self._rx_confidence = 0
         self._rx_confidence_timestamp = 0
         self._tx_buffer = []
+        # set when a packet is queued, so the transmit loop sleeps until there is work
+        self._tx_event = threading.Event()
+        # stop an idle transmit subprocess after this many seconds, None to disable
+        self._tx_idle_timeout = 60
+        self._tx_last_send_timestamp = 0
         self._rx = None
         self._tx = None
+        self._rx_selector = None
+        self._rx_wake_read = None
+        self._rx_wake_write = None
+        self._framer = None
 
         # determine baudrate based on specified baudmode
         #TODO does not support float baudrates
@@ -426,8 +588,19 @@ class Modem:
     def start(self):
         '''Start modem monitoring loops and subprocesses.'''
         self._rx = FSKReceive(alsa_dev=self.alsa_in, baudmode=self.baudmode, sync_byte=self.sync_byte, confidence=self.confidence, mark=self.mark, space=self.space)
-        self._tx = FSKTransmit(alsa_dev=self.alsa_out, baudmode=self.baudmode, sync_byte=self.sync_byte, confidence=self.confidence, mark=self.mark, space=self.space)
+        # transmit subprocess starts lazily on first send, which avoids audio device
+        # contention with the receive subprocess while there is nothing to transmit
+        self._tx = FSKTransmit(alsa_dev=self.alsa_out, baudmode=self.baudmode, sync_byte=self.sync_byte, confidence=self.confidence, mark=self.mark, space=self.space, start=False)
         self.online = True
+        self._framer = Framer(self.MTU)
+
+        # selector blocks the receive loop until data is available instead of polling
+        self._rx_selector = selectors.DefaultSelector()
+        self._rx_selector.register(self._rx._stdout_fd, selectors.EVENT_READ)
+        # self-pipe allows stop() to wake the receive loop immediately
+        self._rx_wake_read, self._rx_wake_write = os.pipe()
+        os.set_blocking(self._rx_wake_read, False)
+        self._rx_selector.register(self._rx_wake_read, selectors.EVENT_READ)
 
         # start the receive loop as a thread since reads from the child process are blocking
         rx_thread = threading.Thread(target=self._rx_loop)
@@ -448,16 +621,34 @@ class Modem:
         '''Stop modem and subprocesses.'''
         self.online = False
 
-        # use a thread to stop the child process non-blocking-ly
+        # wake the transmit loop so it exits without waiting for its timeout
+        self._tx_event.set()
+
+        # wake the receive loop so it exits without waiting for the selector timeout
+        if self._rx_wake_write is not None:
+            try:
+                os.write(self._rx_wake_write, b'\x00')
+            except OSError:
+                pass
+
+        # stopping a child process only blocks for as long as it takes the process to exit
         if self._tx is not None:
-            stop_tx_thread = threading.Thread(target=self._tx.stop)
-            stop_tx_thread.daemon = True
-            stop_tx_thread.start()
-        # use a thread to stop the child process non-blocking-ly
+            self._tx.stop()
         if self._rx is not None:
-            stop_rx_thread = threading.Thread(target=self._rx.stop)
-            stop_rx_thread.daemon = True
-            stop_rx_thread.start()
+            self._rx.stop()
+
+        # close the selector and wake pipe to reclaim the file descriptors
+        if self._rx_selector is not None:
+            self._rx_selector.close()
+            self._rx_selector = None
+        if self._rx_wake_read is not None:
+            try:
+                os.close(self._rx_wake_read)
+                os.close(self._rx_wake_write)
+            except OSError:
+                pass
+            self._rx_wake_read = None
+            self._rx_wake_write = None
 
     def set_rx_callback(self, callback):
         '''Set incoming packet callback function.
@@ -532,8 +723,10 @@ class Modem:
         if not isinstance(data, bytes):
             raise TypeError( 'Data must be of type bytes, {} given'.format( type(data) ) )
 
-        data = HDLC.START + data + HDLC.STOP
-        self._tx_buffer.append(data)
+        # framing flags are kept as separate fragments and gathered at write time
+        self._tx_buffer.append( (HDLC.START, data, HDLC.STOP) )
+        # wake the transmit loop
+        self._tx_event.set()
 
     def _toggle_ptt(self):
         '''Toggle radio PTT via callback function.'''
@@ -543,23 +736,66 @@ class Modem:
 
             self._toggle_ptt_callback()
     
-    def _receive_next(self):
-        '''Get next byte from receive minimodem instance.
+    def _receive_chunk(self):
+        '''Get available bytes from receive minimodem instance.
 
-        Always call this function from a thread since the underlying subprocess pipe read will not return until data is available.
-        Validation of the received byte is performed by attempting to decode the byte and catching any UnicodeDecodeError exceptions.
+        Blocks in the selector until data is available on the subprocess pipe (or the wake pipe is written on stop), then reads all available data in a single chunk.
+        Receiver noise bytes are removed from the chunk before it is returned: only printable ASCII, tab, newline, and carriage return are retained, so control bytes never reach the packet callbacks.
 
         Returns:
-            bytes: Received byte string (may be  b'' if a decode error occured)
+            bytes: Received byte string (may be b'' if no data was received)
         '''
-        data = self._rx.receive()
+        rx_selector = self._rx_selector
+        if rx_selector is None:
+            return b''
 
-        # capture characters that cannot be decoded (receiver noise)
+        # block until data is available instead of polling
+        # a selector closed by stop() raises ValueError, a closed descriptor raises OSError
         try:
-            data.decode('utf-8')
-        except UnicodeDecodeError:
+            events = rx_selector.select(timeout=0.5)
+        except (OSError, ValueError):
             return b''
-        
+
+        rx_ready = False
+        for key, event in events:
+            if key.fd == self._rx_wake_read:
+                # drain the wake pipe written by stop()
+                try:
+                    os.read(key.fd, 64)
+                except OSError:
+                    pass
+            else:
+                rx_ready = True
+
+        if not self.online:
+            return b''
+
+        # drain everything currently queued in the pipe so each selector
+        # wakeup handles many bytes instead of one read's worth
+        chunks = []
+        while True:
+            data = self._rx.receive_available()
+            if len(data) == 0:
+                break
+            chunks.append(data)
+
+        if len(chunks) == 0:
+            if rx_ready:
+                # a readable descriptor with no data means the rx subprocess closed
+                # its stdout (process exited), stop the modem instead of spinning on
+                # the permanently readable end-of-file condition
+                try:
+                    rx_selector.unregister(self._rx._stdout_fd)
+                except (KeyError, ValueError, OSError):
+                    pass
+                self.stop()
+            return b''
+
+        data = b''.join(chunks)
+
+        # remove receiver noise bytes in a single pass, avoiding the codec machinery
+        data = data.translate(None, _NOISE_BYTES)
+
         if self._debug:
             print(data.decode('utf-8'), sep='', end='', flush=True)
 
@@ -591,56 +827,35 @@ class Modem:
             rx_thread.daemon = True
             rx_thread.start()
 
+    def _deliver_rx_frame(self, data):
+        '''Deliver a complete packet extracted by the framer.
+
+        Waits briefly for confidence data to be available before calling the rx callback functions.
+
+        Args:
+            data (bytes): received packet data
+        '''
+        # wait for confidence data to be available
+        #TODO test timeout duration on a slow platform (i.e Raspberry Pi)
+        if self._rx_confidence_timestamp == 0:
+            timeout = time.time() + 0.1 # 100 ms
+            while self._rx_confidence_timestamp == 0 and time.time() <= timeout:
+                time.sleep(0.001) # 1 millisecond
+
+        self._process_rx_callback(data, self._rx_confidence)
+        # reset confidence data to avoid reuse
+        self._rx_confidence = 0
+        self._rx_confidence_timestamp = 0
+
     def _rx_loop(self):
         '''Receive incoming bytes into a buffer and find data packets.
 
         The rx callback function is called once a complete packet is received.
         '''
-        data_buffer = b''
-        max_data_buffer_len = 1024
-
         while self.online:
-            # blocks until next character received
-            data_buffer += self._receive_next()
-            
-            if HDLC.START in data_buffer:
-                if HDLC.STOP in data_buffer:
-                    # delimiters found, capture substring
-                    start = data_buffer.find(HDLC.START) + len(HDLC.START)
-                    end = data_buffer.find(HDLC.STOP, start)
-                    if end > start:
-                        data = data_buffer[start:end]
-                        # remove received data from buffer
-                        data_buffer = data_buffer[end + len(HDLC.STOP):]
-                        
-                        # under max packet length, receive data
-                        if len(data) <= self.MTU:
-                            # wait for confidence data to be available
-                            #TODO test timeout duration on a slow platform (i.e Raspberry Pi)
-                            if self._rx_confidence_timestamp == 0:
-                                timeout = time.time() + 0.1 # 100 ms
-                                while self._rx_confidence_timestamp == 0 and time.time() <= timeout:
-                                    time.sleep(0.001) # 1 millisecond
-
-                            self._process_rx_callback(data, self._rx_confidence)
-                            # reset confidence data to avoid reuse
-                            self._rx_confidence = 0
-                            self._rx_confidence_timestamp = 0
-
-                        else:
-                            # over max packet length, drop data
-                            pass
-                    else:
-                        # partial packets causing mixed up delimiters, remove buffer data up to last start delimiter
-                        data_buffer = data_buffer[start + len(HDLC.START):]
-                else:
-                    if len(data_buffer) > max_data_buffer_len:
-                        # no end delimiter and buffer length over max packaet size, remove buffer data up to last start delimiter
-                        data_buffer = data_buffer[data_buffer.rfind(HDLC.START):]
-            else:
-                # avoid missing start delimiter split over multiple loop iterations
-                if len(data_buffer) > 10 * len(HDLC.START):
-                    data_buffer = b''
+            # blocks until data received or timeout
+            chunk = self._receive_chunk()
+            self._framer.feed(chunk, self._deliver_rx_frame)
 
             #TODO test timeout duration on a slow platform (i.e Raspberry Pi)
             # discard confidence data if older than 100 ms
@@ -648,62 +863,95 @@ class Modem:
                 self._rx_confidence = 0
                 self._rx_confidence_timestamp = 0
 
-            # simmer down
-            time.sleep(0.001)
-
     def _tx_loop(self):
         '''Process data in the transmit buffer.'''
         while self.online:
-            time.sleep(0.01) # 10 ms
-            
+            # block until a packet is queued instead of polling, waking periodically
+            # to re-check carrier state and the transmit idle timeout
+            self._tx_event.wait(timeout=0.5)
+
+            # stop() sets the event to wake this loop, do not process queued packets
+            if not self.online:
+                break
+
             if self.carrier_sense:
+                time.sleep(0.01) # 10 ms
                 continue
 
-            # process transmit buffer
-            if len(self._tx_buffer) > 0:
-                # random delay (100 - 250 ms) before transmitting to avoid collisions
-                time.sleep(random.uniform(0.10, 0.25))
-                
-                if self.carrier_sense:
+            # stop the transmit subprocess when idle to free the audio device
+            if (
+                self._tx.online and
+                len(self._tx_buffer) == 0 and
+                self._tx_idle_timeout is not None and
+                time.time() > self._tx_last_send_timestamp + self._tx_idle_timeout
+            ):
+                self._tx.stop()
+
+            if len(self._tx_buffer) == 0:
+                self._tx_event.clear()
+                # re-check in case a packet was queued before the event was cleared
+                if len(self._tx_buffer) == 0:
                     continue
 
-                # track bytes sent and start time
-                tx_bit_count = 0
-                tx_start_timestamp = time.time()
-                self._toggle_ptt()
-                time.sleep(0.1) # 100 ms
-                
-                while len(self._tx_buffer) > 0:
-                    data = self._tx_buffer.pop(0)
-
-                    if self._debug:
-                        print('TX: ' + data.decode('utf-8'))
-
-                    self._tx.send(data)
-                    tx_bit_count += len(data) * 8
-
-                # calculate duration of transmission based on number of bits sent
-                if self.sync_byte is not None:
-                    # minimodem adds 16 leading sync bytes, plus start and stop bytes for each sync byte
-                    tx_bit_count += 16 * (8 + 2)
-
-                # bits sent / baudrate = transmit time in seconds
-                tx_duration = tx_bit_count / self.baudrate
-                # 1.3x mupltiplier necessary to align with actual transmit duration
-                tx_duration *= 1.3
-                # 0.5 sec ptt tail
-                tx_duration += 0.5
-
-                tx_end_timestamp = tx_start_timestamp + tx_duration
-                
-                while time.time() < tx_end_timestamp:
-                    time.sleep(0.1) # 100 ms
-                    
-                self._toggle_ptt()
+            # random delay (100 - 250 ms) before transmitting to avoid collisions
+            time.sleep(random.uniform(0.10, 0.25))
+
+            if self.carrier_sense:
+                continue
+
+            # avoid respawning the transmit subprocess if stop() was called during the delay
+            if not self.online:
+                break
+
+            # start the transmit subprocess on first send
+            if not self._tx.online:
+                try:
+                    self._tx.start()
+                except SubprocessError:
+                    # failed tx subprocess (ex. bad or busy ALSA device), stop the
+                    # modem instead of silently killing the transmit thread and
+                    # re-raise so the failure is reported
+                    self.stop()
+                    raise
+
+            # track bytes sent and start time
+            tx_bit_count = 0
+            tx_start_timestamp = time.time()
+            self._toggle_ptt()
+            time.sleep(0.1) # 100 ms
+
+            while len(self._tx_buffer) > 0:
+                parts = self._tx_buffer.pop(0)
 
                 if self._debug:
-                    duration = tx_end_timestamp - tx_start_timestamp
-                    print('{} bits at {} bps     tx duration: {} s'.format(tx_bit_count, self.baudrate, tx_duration))
+                    print('TX: ' + b''.join(parts).decode('utf-8'))
+
+                self._tx.send_frames(*parts)
+                tx_bit_count += sum(len(part) for part in parts) * 8
+
+            # calculate duration of transmission based on number of bits sent
+            if self.sync_byte is not None:
+                # minimodem adds 16 leading sync bytes, plus start and stop bytes for each sync byte
+                tx_bit_count += 16 * (8 + 2)
+
+            # bits sent / baudrate = transmit time in seconds
+            tx_duration = tx_bit_count / self.baudrate
+            # 1.3x mupltiplier necessary to align with actual transmit duration
+            tx_duration *= 1.3
+            # 0.5 sec ptt tail
+            tx_duration += 0.5
+
+            tx_end_timestamp = tx_start_timestamp + tx_duration
+
+            while time.time() < tx_end_timestamp:
+                time.sleep(0.1) # 100 ms
+
+            self._toggle_ptt()
+            self._tx_last_send_timestamp = time.time()
+
+            if self._debug:
+                duration = tx_end_timestamp - tx_start_timestamp
+                print('{} bits at {} bps     tx duration: {} s'.format(tx_bit_count, self.baudrate, tx_duration))
 
 
     def _stderr_loop(self):
@@ -0,0 +1,80 @@
+import random
+import unittest
+
+import fskmodem
+from fskmodem import HDLC
+
+
+# matches fskmodem.Modem default MTU
+MTU = 500
+
+# includes frames at and around the MTU boundary, plus inter-frame noise
+# containing partial delimiter bytes
+FRAMES = [b'hello', b'x' * MTU, b'world', b'y' * (MTU + 1), b'z' * (MTU - 1), b'last']
+
+def build_stream():
+    '''Build a noisy byte stream and the list of packets a framer should extract from it.'''
+    stream = b'|<>noise'
+    expected = []
+
+    for frame in FRAMES:
+        stream += HDLC.START + frame + HDLC.STOP + b'|<>noise'
+        if len(frame) <= MTU:
+            expected.append(frame)
+
+    return stream, expected
+
+
+class TestFramer(unittest.TestCase):
+    '''Test fskmodem.Framer packet extraction.'''
+
+    def scan(self, chunks):
+        '''Feed chunks to a new framer and return the delivered packets.'''
+        framer = fskmodem.Framer(MTU)
+        frames = []
+
+        for chunk in chunks:
+            framer.feed(chunk, frames.append)
+
+        return frames
+
+    def test_one_shot(self):
+        stream, expected = build_stream()
+        self.assertEqual(self.scan([stream]), expected)
+
+    def test_byte_wise_chunking(self):
+        stream, expected = build_stream()
+        chunks = [stream[i:i + 1] for i in range(len(stream))]
+        self.assertEqual(self.scan(chunks), expected)
+
+    def test_random_chunking_invariance(self):
+        # delivered packets must not depend on how the stream is split into chunks
+        stream, expected = build_stream()
+        rng = random.Random(42)
+
+        for _ in range(250):
+            chunks = []
+            position = 0
+            while position < len(stream):
+                size = rng.randint(1, 17)
+                chunks.append(stream[position:position + size])
+                position += size
+
+            self.assertEqual(self.scan(chunks), expected)
+
+    def test_mtu_frame_with_split_stop_delimiter(self):
+        # an exactly-MTU frame must survive its stop delimiter straddling a feed boundary
+        frame = b'm' * MTU
+        chunks = [HDLC.START + frame + HDLC.STOP[:1], HDLC.STOP[1:]]
+        self.assertEqual(self.scan(chunks), [frame])
+
+    def test_over_mtu_frame_dropped(self):
+        frame = b'o' * (MTU + 1)
+        self.assertEqual(self.scan([HDLC.START + frame + HDLC.STOP]), [])
+
+    def test_empty_frame_dropped(self):
+        self.assertEqual(self.scan([HDLC.START + HDLC.STOP + HDLC.START + b'ok' + HDLC.STOP]), [b'ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()